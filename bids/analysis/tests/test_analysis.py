@@ -10,11 +10,17 @@ from bids.tests import get_test_data_path
 from bids.variables import BIDSVariableCollection
 
 
-@pytest.fixture
-def analysis():
+@pytest.fixture(scope="module")
+def layout():
+    # The layout scan is expensive and the layout is never mutated, so share
+    # one instance across the module.
     layout_path = join(get_test_data_path(), "ds005")
-    layout = BIDSLayout(layout_path)
-    json_file = join(layout_path, "models", "ds-005_type-test_model.json")
+    return BIDSLayout(layout_path)
+
+
+@pytest.fixture
+def analysis(layout):
+    json_file = join(layout.root, "models", "ds-005_type-test_model.json")
     analysis = Analysis(layout, json_file)
     analysis.setup(scan_length=480, subject=["01", "02"])
     return analysis
@@ -39,10 +45,8 @@ def test_first_level_sparse_design_matrix(analysis):
     }
 
 
-def test_incremental_data_loading():
-    layout_path = join(get_test_data_path(), "ds005")
-    layout = BIDSLayout(layout_path)
-    json_file = join(layout_path, "models", "ds-005_type-test_model.json")
+def test_incremental_data_loading(layout):
+    json_file = join(layout.root, "models", "ds-005_type-test_model.json")
     analysis = Analysis(layout, json_file)
     analysis.setup(scan_length=480, subject=["01"], run=[1], finalize=False)
     analysis.setup(scan_length=480, subject=["02"], run=[2], finalize=False)
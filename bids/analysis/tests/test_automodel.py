@@ -6,20 +6,20 @@ from bids.tests import get_test_data_path
 import pytest
 
 
-@pytest.fixture
-def model():
+@pytest.fixture(scope="module")
+def layout():
     layout_path = join(get_test_data_path(), 'ds005')
-    layout = BIDSLayout(layout_path)
+    return BIDSLayout(layout_path)
+
 
+@pytest.fixture
+def model(layout):
     models = auto_model(layout, scan_length=480, one_vs_rest=True)
 
     return models[0]
 
 
-def test_auto_model_analysis(model):
-
-    layout_path = join(get_test_data_path(), 'ds005')
-    layout = BIDSLayout(layout_path)
+def test_auto_model_analysis(model, layout):
 
     # Test to make sure an analaysis can be setup from the generated model
     analysis = Analysis(layout, model)
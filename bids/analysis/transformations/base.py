@@ -14,6 +14,10 @@ from bids.utils import listify, convert_JSON
 from bids.variables import SparseRunVariable
 from bids.analysis import transformations as pbt
 
+# Matches any special character signalling a variable-name pattern rather
+# than a literal name; compiled once instead of per expanded argument.
+_wildcard = re.compile(r'[\*\?\[\]]')
+
 
 class Transformation(metaclass=ABCMeta):
 
@@ -91,6 +95,13 @@ class Transformation(metaclass=ABCMeta):
     # be passed through as-is even if categorical.
     _allow_categorical = None
 
+    # Boolean indicating whether input variables are cloned before the
+    # transformation is applied. Defaults to True to protect existing
+    # variables from in-place modification. Transformations that never touch
+    # the data--e.g., ones that only rename, select, or delete variables--
+    # can set this to False to avoid copying every value array.
+    _clone_inputs = True
+
     def __new__(cls, collection, variables, *args, **kwargs):
         t = super(Transformation, cls).__new__(cls)
         t._setup(collection, variables, *args, **kwargs)
@@ -140,7 +151,7 @@ class Transformation(metaclass=ABCMeta):
             result = []
             # Only try to match strings containing a relevant special character
             for v in values:
-                if isinstance(v, str) and re.search('[\*\?\[\]]', v):
+                if isinstance(v, str) and _wildcard.search(v):
                     result.append(self.collection.match_variables(v))
                 else:
                     result.append([v])
@@ -161,9 +172,13 @@ class Transformation(metaclass=ABCMeta):
         """Deep copy all variables the transformation touches. This prevents us
         from unnecessarily overwriting existing variables. """
 
-        # Always clone the target variables
-        self._variables = {v: self.collection[v].clone()
-                           for v in self.variables}
+        # Always clone the target variables, unless the transformation has
+        # declared that it leaves the data untouched
+        if self._clone_inputs:
+            self._variables = {v: self.collection[v].clone()
+                               for v in self.variables}
+        else:
+            self._variables = {v: self.collection[v] for v in self.variables}
 
         if not self._variables_used:
             return
@@ -265,8 +280,17 @@ class Transformation(metaclass=ABCMeta):
             # Otherwise loop over variables individually
             else:
                 if self._groupable and self.groupby is not None:
-                    result = col.apply(self._transform, groupby=self.groupby,
-                                       **kwargs)
+                    # Transformations that define a _grouped_transform()
+                    # receive all values plus a grouper, allowing them to use
+                    # vectorized groupby operations instead of incurring a
+                    # Python-level call per group.
+                    if hasattr(self, '_grouped_transform'):
+                        grouper = col.get_grouper(self.groupby)
+                        result = self._grouped_transform(data[i], grouper,
+                                                         **kwargs)
+                    else:
+                        result = col.apply(self._transform,
+                                           groupby=self.groupby, **kwargs)
                 else:
                     result = self._transform(data[i], **kwargs)
 
@@ -115,16 +115,57 @@ class Orthogonalize(Transformation):
         other = listify(other)
 
         # Set up X matrix and slice into it based on target variable indices
-        X = np.array([self._variables[c].values.values.squeeze()
-                      for c in other]).T
+        X = np.column_stack([self._variables[c].values.values.ravel()
+                             for c in other])
         X = X[var.index, :]
         assert len(X) == len(var)
         y = var.values
-        _aX = np.c_[np.ones(len(y)), X]
-        coefs, resids, rank, s = np.linalg.lstsq(_aX, y, rcond=None)
+
+        # The regressors are identical for every target column processed by
+        # this instance, so factorize the design matrix once and reduce each
+        # subsequent column to a single pseudoinverse matmul. The cached X
+        # is checked by content on every hit: when _grouped_transform falls
+        # back on groupby().apply(), equal-sized groups share a key but
+        # carry different design matrices.
+        cache = getattr(self, '_pinv_cache', None)
+        if cache is None:
+            cache = self._pinv_cache = {}
+        cache_key = (tuple(other), X.shape)
+        cached = cache.get(cache_key)
+        if cached is not None and np.array_equal(cached[0], X):
+            pinv = cached[1]
+        else:
+            pinv = np.linalg.pinv(np.c_[np.ones(len(y)), X])
+            cache[cache_key] = (X, pinv)
+        coefs = pinv.dot(y)
         result = pd.DataFrame(y - X.dot(coefs[1:]), index=var.index)
         return result
 
+    def _grouped_transform(self, values, grouper, other):
+        other = listify(other)
+
+        # The closed-form single-regressor solution below doesn't generalize
+        # to multiple regressors, so fall back on the per-group path.
+        if len(other) > 1:
+            return values.groupby(grouper).apply(self._transform, other=other)
+
+        y = np.asarray(values).squeeze()
+        x = self._variables[other[0]].values.values.squeeze()
+        assert len(x) == len(y)
+
+        # Compute the per-group OLS slope in closed form from groupby sums;
+        # each aggregation is a single cython reduction rather than a
+        # Python-level regression per group.
+        df = pd.DataFrame({'x': x, 'y': y, 'xx': x * x, 'xy': x * y})
+        grouped = df.groupby(grouper)
+        n = grouped['x'].transform('count')
+        sx = grouped['x'].transform('sum')
+        sy = grouped['y'].transform('sum')
+        sxx = grouped['xx'].transform('sum')
+        sxy = grouped['xy'].transform('sum')
+        beta = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        return pd.DataFrame(y - beta.values * x, index=values.index)
+
 
 class Product(Transformation):
 
@@ -134,8 +175,9 @@ class Product(Transformation):
     _output_required = True
 
     def _transform(self, data):
-        data = pd.concat(data, axis=1, sort=True)
-        return data.product(1)
+        values = np.column_stack([np.asarray(d) for d in data])
+        # Match pandas' skipna=True: missing values drop out of the product.
+        return pd.Series(np.nanprod(values, axis=1))
 
 
 class Scale(Transformation):
@@ -169,10 +211,43 @@ class Scale(Transformation):
                              "set replace_na to 'after'.".format(val))
         if replace_na == 'before':
             data = data.fillna(0.)
+        if data.values.dtype != np.float64:
+            data = data.astype(np.float64)
+        # Demean/rescale in place on the raw buffer, avoiding the block
+        # reallocation pandas does for each arithmetic op. The NaN-aware
+        # reductions match pandas' skipna and ddof=1 defaults.
+        values = data.values
         if demean:
-            data -= data.mean()
+            np.subtract(values, np.nanmean(values), out=values)
         if rescale:
-            data /= data.std()
+            np.divide(values, np.nanstd(values, ddof=1), out=values)
+        if replace_na == 'after':
+            values[np.isnan(values)] = 0.
+        return data
+
+    def _grouped_transform(self, data, grouper, demean=True, rescale=True,
+                           replace_na=None):
+        # Vectorized equivalent of applying _transform() to each group: the
+        # string aggregators hit pandas' cython groupby kernels directly,
+        # avoiding a Python-level call per group.
+        grouped = data.groupby(grouper)
+        if replace_na in {None, 'before'}:
+            constant = grouped.transform('min') == grouped.transform('max')
+            if constant.any():
+                val = data[constant].iloc[0]
+                raise ValueError("Cannot scale a column with constant value "
+                                 "({})! If you want a constant column of 0's "
+                                 "returned, set replace_na to "
+                                 "'after'.".format(val))
+        if replace_na == 'before':
+            data = data.fillna(0.)
+            grouped = data.groupby(grouper)
+        if demean:
+            data = data - grouped.transform('mean')
+        if rescale:
+            # The std is invariant to demeaning, so the original grouper's
+            # statistics remain valid here.
+            data = data / grouped.transform('std')
         if replace_na == 'after':
             data = data.fillna(0.)
         return data
@@ -186,16 +261,24 @@ class Sum(Transformation):
     _output_required = True
 
     def _transform(self, data, weights=None):
-        data = pd.concat(data, axis=1, sort=True)
+        # Inputs are aligned, so stack the raw arrays and dispatch the
+        # weighted sum to a single matrix-vector multiply.
+        values = np.column_stack([np.asarray(d).ravel() for d in data])
         if weights is None:
-            weights = np.ones(data.shape[1])
+            weights = np.ones(values.shape[1])
         else:
             weights = np.array(weights)
-            if len(weights.ravel()) != data.shape[1]:
+            if len(weights.ravel()) != values.shape[1]:
                 raise ValueError("If weights are passed to sum(), the number "
                                  "of elements must equal number of variables"
                                  " being summed.")
-        return (data * weights).sum(axis=1)
+        # Match pandas' skipna=True: missing values contribute nothing to
+        # the sum rather than poisoning the whole row.
+        if np.issubdtype(values.dtype, np.floating):
+            nan_mask = np.isnan(values)
+            if nan_mask.any():
+                values = np.where(nan_mask, 0., values)
+        return pd.Series(values.dot(weights.ravel()))
 
 
 class Threshold(Transformation):
@@ -228,13 +311,19 @@ class Threshold(Transformation):
 
     def _transform(self, data, threshold=0., binarize=False, above=True,
                    signed=True):
+        # Work on the raw ndarray: one comparison produces the keep mask,
+        # and a single masked write (or dtype cast, for binarize) builds the
+        # output, instead of two pandas boolean assignments.
+        values = np.asarray(data)
         if not signed:
             threshold = np.abs(threshold)
-            data = data.abs()
-        keep = data >= threshold if above else data <= threshold
-        data[~keep] = 0
+            values = np.abs(values)
+        keep = np.greater_equal(values, threshold) if above \
+            else np.less_equal(values, threshold)
         if binarize:
-            data[keep] = 1
+            data[:] = keep.astype(values.dtype)
+        else:
+            data[:] = np.where(keep, values, 0)
         return data
 
 
@@ -253,8 +342,10 @@ class And_(Transformation):
     _aligned_required = True
 
     def _transform(self, dfs):
-        df = pd.concat(dfs, axis=1, sort=True)
-        return df.all(axis=1).astype(int)
+        # Inputs are already aligned, so skip pd.concat's index union and
+        # reduce the stacked boolean array in a single pass.
+        values = np.column_stack([np.asarray(df) for df in dfs])
+        return pd.Series(values.astype(bool).all(axis=1).astype(int))
 
 
 class Not(Transformation):
@@ -288,5 +379,12 @@ class Or_(Transformation):
     _aligned_required = True
 
     def _transform(self, dfs):
-        df = pd.concat(dfs, axis=1, sort=True)
-        return df.any(axis=1).astype(int)
+        # np.any treats nonzero as True, so no intermediate bool cast is
+        # needed -- but NaN is nonzero, so missing values must be zeroed
+        # first to match pandas' skipna behavior.
+        values = np.column_stack([np.asarray(df) for df in dfs])
+        if np.issubdtype(values.dtype, np.floating):
+            nan_mask = np.isnan(values)
+            if nan_mask.any():
+                values = np.where(nan_mask, 0., values)
+        return pd.Series(values.any(axis=1).astype(int))
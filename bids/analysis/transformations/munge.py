@@ -102,6 +102,7 @@ class Delete(Transformation):
     _input_type = 'variable'
     _return_type = 'none'
     _allow_categorical = ('variables',)
+    _clone_inputs = False
 
     def _transform(self, variables):
         variables = set([v.name for v in variables])
@@ -119,8 +120,13 @@ class DropNA(Transformation):
 
     def _transform(self, var):
 
-        # Identify non-NA rows
-        valid = var.values.notna().values
+        # Identify non-NA rows. For float data this is a single vectorized
+        # isnan pass; other dtypes go through pandas' notna.
+        values = np.asarray(var.values).ravel()
+        if values.dtype.kind == 'f':
+            valid = ~np.isnan(values)
+        else:
+            valid = pd.notna(values)
         var.select_rows(valid)
         return var
 
@@ -132,6 +138,30 @@ class Factor(Transformation):
     _return_type = 'variable'
     _allow_categorical = ('variables',)
 
+    @staticmethod
+    def dummies(values):
+        """One-hot encode an array of values.
+
+        Parameters
+        ----------
+        values : array_like
+            The values to dummy-code.
+
+        Returns
+        -------
+        tuple
+            A 2-tuple of the (n, k) float64 one-hot matrix and the list of k
+            sorted levels its columns correspond to.
+        """
+        # A single factorization pass yields integer codes plus sorted
+        # levels; the full dummy matrix is then one fancy-index store into a
+        # preallocated array, rather than a per-level pandas column build.
+        codes, levels = pd.factorize(values, sort=True)
+        dummies = np.zeros((len(codes), len(levels)), dtype=np.float64)
+        valid = codes >= 0  # factorize assigns -1 to missing values
+        dummies[np.flatnonzero(valid), codes[valid]] = 1.
+        return dummies, list(levels)
+
     def _transform(self, var, constraint='none', ref_level=None, sep='.'):
 
         result = []
@@ -139,24 +169,31 @@ class Factor(Transformation):
         orig_name = var.name
         variableClass = var.__class__
 
-        levels = np.sort(data['amplitude'].unique())
-        new_cols = pd.get_dummies(data['amplitude'], drop_first=False)[levels]
+        dummies, levels = self.dummies(data['amplitude'].values)
+        k = len(levels)
 
-        if len(levels) > 1 and constraint in ('drop_one', 'mean_zero'):
+        if k > 1 and constraint in ('drop_one', 'mean_zero'):
             if ref_level is None:
                 ref_level = levels[0]
-            new_cols = new_cols.drop(ref_level, axis=1)
 
             if constraint == 'mean_zero':
-                ref_inds = data['amplitude'] == ref_level
-                new_cols.loc[ref_inds, :] = -1. / (len(levels) - 1)
-
-        for lev in levels:
+                # The reference level's own column is dropped below, so the
+                # whole row can be overwritten in one assignment.
+                ref_rows = dummies[:, levels.index(ref_level)].astype(bool)
+                dummies[ref_rows, :] = -1. / (k - 1)
+
+        # Entity columns are shared across all output variables, so pull the
+        # underlying arrays out once instead of copying the DataFrame per
+        # level.
+        shared_cols = {c: data[c].values for c in data.columns
+                       if c != 'amplitude'}
+
+        for j, lev in enumerate(levels):
             if ref_level is not None and lev == ref_level:
                 continue
             name = ''.join([var.name, sep, str(lev)])
-            lev_data = data.copy()
-            lev_data['amplitude'] = new_cols[lev].astype(float)
+            lev_data = pd.DataFrame(dict(shared_cols,
+                                         amplitude=dummies[:, j]))
             args = [name, lev_data, var.source]
             if hasattr(var, 'run_info'):
                 args.insert(2, var.run_info)
@@ -179,6 +216,10 @@ class Filter(Transformation):
     _aligned_variables = ('by')
     _allow_categorical = ('variables', 'by')
 
+    # Sanitized queries/names, keyed on (query, names). The rewrite depends
+    # only on those inputs, so repeated Filter calls reuse it.
+    _query_cache = {}
+
     def _transform(self, var, query, by=None):
 
         if by is None:
@@ -186,19 +227,27 @@ class Filter(Transformation):
 
         names = [var.name] + listify(by)
 
-        # assure ordered dict so we have consistent (if not correct) operation,
-        # because later we ask for name_map.values
-        # pandas .query can't handle non-identifiers in variable names, so we
-        # need to replace them in both the variable names and the query string.
-        name_map = odict((n, re.sub('[^a-zA-Z0-9_]+', '_', n)) for n in names)
-        for k, v in name_map.items():
-            query = query.replace(k, v)
+        cache_key = (query, tuple(names))
+        cached = self._query_cache.get(cache_key)
+        if cached is None:
+            # assure ordered dict so we have consistent (if not correct)
+            # operation, because later we ask for name_map.values
+            # pandas .query can't handle non-identifiers in variable names,
+            # so we need to replace them in both the variable names and the
+            # query string.
+            name_map = odict((n, re.sub('[^a-zA-Z0-9_]+', '_', n))
+                             for n in names)
+            for k, v in name_map.items():
+                query = query.replace(k, v)
+            cached = (query, list(name_map.values()))
+            self._query_cache[cache_key] = cached
+        query, clean_names = cached
 
         data = pd.concat([self.collection[n].values for n in names],
                          axis=1, sort=True)
         # Make sure we can use integer index
         data = data.reset_index(drop=True)
-        data.columns = list(name_map.values())
+        data.columns = clean_names
         data = data.query(query)
 
         # Truncate target variable to retained rows
@@ -234,6 +283,7 @@ class Rename(Transformation):
     _output_required = True
     _input_type = 'variable'
     _allow_categorical = ('variables',)
+    _clone_inputs = False
 
     def _transform(self, var):
         # Rename happens automatically in the base class, so all we need to
@@ -249,14 +299,53 @@ class Replace(Transformation):
     _return_type = 'variable'
     _allow_categorical = ('variables',)
 
+    @staticmethod
+    def _replace_numeric(values, replace):
+        """Apply a replacement dict to a numeric array via a sorted-key
+        lookup table--two vectorized passes instead of a Python-level hash
+        per element. Returns None if the dict contains non-numeric keys or
+        values, in which case the caller should fall back on pandas.
+        """
+        # Require real numbers, not merely float-coercible objects: pandas
+        # does not match string keys like '1' against numeric values, and
+        # bools only match their own dtype, so both take the fallback path.
+        numeric = (int, float, np.integer, np.floating)
+        if not all(isinstance(x, numeric) and not isinstance(x, bool)
+                   for item in replace.items() for x in item):
+            return None
+        # The searchsorted equality test can never match a NaN key, so NaN
+        # replacement also needs the pandas path.
+        if any(np.isnan(k) for k in replace.keys()):
+            return None
+        keys = np.fromiter(replace.keys(), np.float64, len(replace))
+        new_vals = np.fromiter(replace.values(), np.float64, len(replace))
+        order = np.argsort(keys)
+        keys, new_vals = keys[order], new_vals[order]
+        idx = np.minimum(np.searchsorted(keys, values), len(keys) - 1)
+        hit = keys[idx] == values
+        return np.where(hit, new_vals[idx], values)
+
     def _transform(self, var, replace, attribute='value'):
 
         if attribute == 'value':
-            var.values = var.values.replace(replace)
-        elif attribute == 'onset':
-            var.onset = pd.Series(var.onset).replace(replace).values
-        elif attribute == 'duration':
-            var.duration = pd.Series(var.duration).replace(replace).values
+            values = None
+            # Bool-dtype data stays on the pandas path: numeric keys don't
+            # match bools in Series.replace, just as bool keys don't match
+            # numeric data.
+            if isinstance(var.values, pd.Series) and \
+                    var.values.values.dtype.kind in 'if':
+                values = self._replace_numeric(var.values.values, replace)
+            if values is None:
+                var.values = var.values.replace(replace)
+            else:
+                var.values = pd.Series(values, index=var.values.index,
+                                       name=var.values.name)
+        elif attribute in ('onset', 'duration'):
+            values = self._replace_numeric(getattr(var, attribute), replace)
+            if values is None:
+                values = pd.Series(getattr(var, attribute)) \
+                    .replace(replace).values
+            setattr(var, attribute, values)
         else:
             raise ValueError("Invalid attribute. Must be one of 'value',"
                              "'onset', or 'duration'.")
@@ -278,6 +367,7 @@ class Select(Transformation):
     _input_type = 'variable'
     _return_type = 'none'
     _allow_categorical = ('variables',)
+    _clone_inputs = False
 
     def _transform(self, variables):
         self.collection.variables = {v.name: v for v in variables}
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 import click
 
@@ -14,8 +15,8 @@ class PathOrRegex(click.ParamType):
     name = "path or m/regex/"
 
     def convert(self, value, param, ctx):
-        import re
-        if re.match(r"^m/.*/$", value):  # has form "m/<regex>/"
+        # has form "m/<regex>/"; prefix/suffix checks beat an anchored regex
+        if len(value) >= 3 and value.startswith('m/') and value.endswith('/'):
             value = re.compile(value[2:-1])
         return value
 
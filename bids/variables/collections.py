@@ -3,6 +3,7 @@ from copy import copy
 import warnings
 import re
 from collections import OrderedDict
+from functools import lru_cache
 from itertools import chain
 import fnmatch
 
@@ -20,6 +21,14 @@ from .variables import (
 from bids.utils import listify, matches_entities
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern):
+    """Compile a regex, caching the result so repeated variable-name
+    expansions (e.g., one per transformation) don't recompile the same
+    pattern."""
+    return re.compile(pattern)
+
+
 class BIDSVariableCollection(object):
     """A container for one or more variables extracted from variable files
     at a single level of analysis.
@@ -162,14 +171,17 @@ class BIDSVariableCollection(object):
             idx_cols = list(valid_vars & all_cols)
 
             df["amplitude"] = df["amplitude"].fillna("n/a")
+            # observed=True keeps categorical entity columns from expanding
+            # into the full cross-product of category levels
             wide_df = df.pivot_table(
-                index=idx_cols, columns="condition", values="amplitude", aggfunc="first"
+                index=idx_cols, columns="condition", values="amplitude",
+                aggfunc="first", observed=True
             )
 
             select_cols = list(set(ent_cols) - set(idx_cols))
 
             if entities and select_cols:
-                ent_df = df.groupby(idx_cols)[select_cols].first()
+                ent_df = df.groupby(idx_cols, observed=True)[select_cols].first()
                 df = pd.concat([wide_df, ent_df], axis=1)
             else:
                 df = wide_df
@@ -288,7 +300,7 @@ class BIDSVariableCollection(object):
         results = []
         for patt in pattern:
             if match_type.lower().startswith("re"):
-                patt = re.compile(patt)
+                patt = _compile_pattern(patt)
                 vars_ = [v for v in self.variables.keys() if patt.search(v)]
             else:
                 vars_ = fnmatch.filter(list(self.variables.keys()), patt)
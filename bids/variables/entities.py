@@ -184,11 +184,14 @@ class NodeIndex(object):
         if entities is None:
             return self.nodes
 
-        match_ents = set(entities.keys())
-        common_cols = list(match_ents & set(self.index.columns))
+        # Preserve the caller's entity ordering (set intersection would give
+        # an unstable column order) and probe the column Index directly
+        # instead of building a throwaway set per call.
+        common_cols = [ent for ent in entities if ent in self.index.columns]
 
-        if strict and match_ents - common_cols:
-            raise ValueError("Invalid entities: ", match_ents - common_cols)
+        if strict and len(common_cols) < len(entities):
+            invalid = set(entities) - set(common_cols)
+            raise ValueError("Invalid entities: ", invalid)
 
         if not common_cols:
             return self.nodes
@@ -209,7 +212,7 @@ class NodeIndex(object):
         # Sort and return
         sort_cols = ['subject', 'session', 'task', 'run', 'node_index',
                      'suffix', 'level', 'datatype']
-        sort_cols = [sc for sc in sort_cols if sc in set(rows.columns)]
+        sort_cols = [sc for sc in sort_cols if sc in rows.columns]
         rows = rows.sort_values(sort_cols)
         inds = rows['node_index'].astype(int)
         return [self.nodes[i] for i in inds]
@@ -9,7 +9,7 @@ from bids.tests import get_test_data_path
 from bids.config import set_option, get_option
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def layout1():
     path = join(get_test_data_path(), 'ds005')
     layout = BIDSLayout(path)
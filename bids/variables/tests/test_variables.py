@@ -24,7 +24,7 @@ def generate_DEV(name='test', sr=20, duration=480):
                             source='dummy', sampling_rate=sr)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def layout1():
     path = join(get_test_data_path(), 'ds005')
     layout = BIDSLayout(path)
@@ -38,6 +38,14 @@ def layout2():
     return layout
 
 
+@pytest.fixture(scope="module")
+def index1(layout1):
+    # Parsing the event files is comparatively expensive, and none of the
+    # tests below mutate the loaded variables, so load the run-level dataset
+    # once per module.
+    return load_variables(layout1, types='events', scan_length=480)
+
+
 def test_dense_event_variable_init():
     dev = generate_DEV()
     assert dev.sampling_rate == 20
@@ -62,8 +70,8 @@ def test_merge_wrapper():
         merge_variables([dev, sev])
 
 
-def test_sparse_run_variable_to_dense(layout1):
-    index = load_variables(layout1, types='events', scan_length=480)
+def test_sparse_run_variable_to_dense(index1):
+    index = index1
     runs = index.get_nodes('run', {'subject': ['01', '02']})
 
     for _, run in enumerate(runs):
@@ -82,8 +90,8 @@ def test_sparse_run_variable_to_dense(layout1):
         assert dense.source == 'events'
 
 
-def test_sparse_run_variable_to_dense_default_sr(layout1):
-    index = load_variables(layout1, types='events', scan_length=480)
+def test_sparse_run_variable_to_dense_default_sr(index1):
+    index = index1
     runs = index.get_nodes('run', {'subject': ['01', '02']})
 
     for i, run in enumerate(runs):
@@ -105,9 +113,9 @@ def test_sparse_run_variable_to_dense_default_sr(layout1):
         assert dense.source == 'events'
 
 
-def test_merge_densified_variables(layout1):
+def test_merge_densified_variables(index1):
     SR = 10
-    dataset = load_variables(layout1, types='events', scan_length=480)
+    dataset = index1
     runs = dataset.get_nodes('run')
     vars_ = [r.variables['RT'].to_dense(SR) for r in runs]
     dense = merge_variables(vars_)
@@ -122,9 +130,9 @@ def test_merge_densified_variables(layout1):
         assert dense_vals.equals(run_vals)
 
 
-def test_densify_merged_variables(layout1):
+def test_densify_merged_variables(index1):
     SR = 10
-    dataset = load_variables(layout1, types='events', scan_length=480)
+    dataset = index1
     runs = dataset.get_nodes('run')
     vars_ = [r.variables['RT'] for r in runs]
     var = merge_variables(vars_)
@@ -154,8 +162,8 @@ def test_merge_simple_variables(layout2):
     assert variables[3].values.iloc[1] == merged.values.iloc[7]
 
 
-def test_merge_sparse_run_variables(layout1):
-    dataset = load_variables(layout1, types='events', scan_length=480)
+def test_merge_sparse_run_variables(index1):
+    dataset = index1
     runs = dataset.get_nodes('run')
     variables = [r.variables['RT'] for r in runs]
     n_rows = sum([len(c.values) for c in variables])
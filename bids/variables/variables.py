@@ -2,7 +2,6 @@
 
 import math
 import warnings
-from copy import deepcopy
 from abc import abstractmethod, ABCMeta
 from itertools import chain
 from functools import reduce
@@ -26,6 +25,9 @@ class BIDSVariable(metaclass=ABCMeta):
         self.values = values
         self.source = source
         self.entities = self._extract_entities()
+        # Composite group keys built by get_grouper, keyed on the groupby
+        # spec. Cleared whenever the index changes (e.g., select_rows).
+        self._grouper_cache = {}
 
     def clone(self, data=None, **kwargs):
         """Clone (deep copy) the current column, optionally replacing its
@@ -42,8 +44,23 @@ class BIDSVariable(metaclass=ABCMeta):
             values to set in the copy. E.g., passing `name='my_name'`
             would set the `.name` attribute on the cloned instance to the
             passed value.
+
+        Notes
+        -----
+        Clones share immutable metadata (``entities``, the ``RunInfo``
+        tuples) with the original by reference; only the data-bearing
+        attributes that callers may modify in place are copied.
         """
-        result = deepcopy(self)
+        result = object.__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        result.values = self.values.copy()
+        if hasattr(self, 'index'):
+            result.index = self.index.copy()
+        if hasattr(self, 'run_info'):
+            result.run_info = list(self.run_info)
+        for prop in self._property_columns:
+            setattr(result, prop, getattr(self, prop).copy())
+        result._grouper_cache = {}
         if data is not None:
             if data.shape != self.values.shape:
                 # If data can be re-shaped safely, do so
@@ -114,6 +131,7 @@ class BIDSVariable(metaclass=ABCMeta):
 
             var.values = var.values.loc[inds]
             var.index = var.index.loc[inds]
+            var._grouper_cache = {}
             if hasattr(self, '_build_entity_index'):
                 var._build_entity_index()
 
@@ -178,9 +196,22 @@ class BIDSVariable(metaclass=ABCMeta):
         list
             A list defining the groups.
         """
-        grouper = self.index.loc[:, groupby]
-        return grouper.apply(lambda x: '@@@'.join(x.astype(str).values),
-                             axis=1)
+        cache_key = tuple(listify(groupby))
+        if cache_key in self._grouper_cache:
+            return self._grouper_cache[cache_key]
+        grouper = self.index.loc[:, listify(groupby)]
+        # Build the composite key with column-wise vectorized concatenation
+        # rather than a Python-level join per row.
+        key = grouper.iloc[:, 0].astype(str)
+        for col in grouper.columns[1:]:
+            key = key + '@@@' + grouper[col].astype(str)
+        self._grouper_cache[cache_key] = key
+        return key
+
+    # Named reductions with Cython-backed groupby implementations; these
+    # avoid the per-group Python dispatch incurred by .apply().
+    _fast_reducers = {'mean', 'sum', 'std', 'var', 'min', 'max', 'count',
+                      'median', 'first', 'last'}
 
     def apply(self, func, groupby='run', *args, **kwargs):
         """Applies the passed function to the groups defined by the groupby
@@ -188,16 +219,20 @@ class BIDSVariable(metaclass=ABCMeta):
 
         Parameters
         ----------
-        func : callable
-            The function to apply to each group.
+        func : callable or str
+            The function to apply to each group. If a string naming a
+            standard reduction (e.g., 'mean', 'sum', 'std'), the optimized
+            pandas groupby method of that name is used directly.
         groupby : str or list
             Name(s) of column(s) defining the grouping.
         args, kwargs : dict
             Optional positional and keyword arguments to pass
             onto the function call.
         """
-        grouper = self.get_grouper(groupby)
-        return self.values.groupby(grouper).apply(func, *args, **kwargs)
+        grouped = self.values.groupby(self.get_grouper(groupby))
+        if isinstance(func, str) and func in self._fast_reducers:
+            return getattr(grouped, func)(*args, **kwargs)
+        return grouped.apply(func, *args, **kwargs)
 
     def to_df(self, condition=True, entities=True, **kwargs):
         """Convert to a DataFrame, with columns for name and entities.
@@ -213,19 +248,24 @@ class BIDSVariable(metaclass=ABCMeta):
             If True, adds extra columns for all entities.
         """
         amp = 'amplitude' if condition else self.name
-        data = pd.DataFrame({amp: self.values.values.ravel()})
+
+        # Gather all columns up front and build the DataFrame in a single
+        # constructor call, rather than growing it column by column and
+        # concatenating the entity block onto it afterwards.
+        values = self.values.values.ravel()
+        columns = {amp: values}
 
         for sc in self._property_columns:
-            data[sc] = getattr(self, sc)
+            columns[sc] = getattr(self, sc)
 
         if condition:
-            data['condition'] = self.name
+            columns['condition'] = np.repeat(self.name, len(values))
 
         if entities:
-            ent_data = self.index.reset_index(drop=True)
-            data = pd.concat([data, ent_data], axis=1, sort=True)
+            for ent in self.index.columns:
+                columns[ent] = self.index[ent].values
 
-        return data.reset_index(drop=True)
+        return pd.DataFrame(columns)
 
     def _extract_entities(self):
         """Returns a dict of all non-varying entities for the current Variable.
@@ -267,10 +307,28 @@ class SimpleVariable(BIDSVariable):
 
     _entity_columns = {'condition', 'amplitude'}
 
+    # Entity column lists, keyed on (input columns, class). Constructors run
+    # thousands of times over frames with a handful of distinct schemas, so
+    # the set arithmetic only needs to happen once per schema.
+    _ent_col_cache = {}
+
     def __init__(self, name, data, source, **kwargs):
 
-        ent_cols = list(set(data.columns) - self._entity_columns)
-        self.index = data.loc[:, ent_cols]
+        cache_key = (frozenset(data.columns), type(self))
+        ent_cols = self._ent_col_cache.get(cache_key)
+        if ent_cols is None:
+            ent_cols = list(set(data.columns) - self._entity_columns)
+            self._ent_col_cache[cache_key] = ent_cols
+        index = data.loc[:, ent_cols]
+
+        # Entity values repeat heavily (a handful of subjects/runs/tasks over
+        # thousands of rows), so store string columns as categoricals: every
+        # downstream groupby then hashes small integer codes instead of one
+        # Python string per row.
+        obj_cols = [col for col in ent_cols if index[col].dtype == object]
+        if obj_cols:
+            index = index.astype({col: 'category' for col in obj_cols})
+        self.index = index
 
         values = data['amplitude'].reset_index(drop=True)
         values.name = name
@@ -292,12 +350,35 @@ class SimpleVariable(BIDSVariable):
         -------
         A list of SparseRunVariables, one per column in the grouper DF.
         """
-        data = self.to_df(condition=True, entities=True)
-        data = data.drop('condition', axis=1)
+        values = grouper.values.astype(bool)
+        # The grouper is typically one-hot (each row belongs to exactly one
+        # group), in which case all row indices can be bucketed with a single
+        # stable argsort over the integer group codes, instead of one boolean
+        # DataFrame filter per output column.
+        if (values.sum(axis=1) == 1).all():
+            codes = values.argmax(axis=1)
+            order = np.argsort(codes, kind='stable')
+            starts = np.searchsorted(codes[order],
+                                     np.arange(grouper.shape[1] + 1))
+            group_rows = [order[starts[i]:starts[i + 1]]
+                          for i in range(grouper.shape[1])]
+        else:
+            group_rows = [np.flatnonzero(values[:, i])
+                          for i in range(grouper.shape[1])]
+
+        # Build each subset directly from the underlying arrays instead of
+        # round-tripping through to_df(), which would rebuild and then
+        # re-parse the entity columns for every group.
+        arrays = {'amplitude': self.values.values}
+        for prop in self._property_columns:
+            arrays[prop] = getattr(self, prop)
+        for ent in self.index.columns:
+            arrays[ent] = self.index[ent].values
 
         subsets = []
         for i, col_name in enumerate(grouper.columns):
-            col_data = data.loc[grouper[col_name].astype(bool), :]
+            rows = group_rows[i]
+            col_data = pd.DataFrame({k: v[rows] for k, v in arrays.items()})
             name = '{}.{}'.format(self.name, col_name)
             col = self.__class__(name=name, data=col_data, source=self.source,
                                  run_info=getattr(self, 'run_info', None))
@@ -307,7 +388,16 @@ class SimpleVariable(BIDSVariable):
     @classmethod
     def _merge(cls, variables, name, **kwargs):
         dfs = [v.to_df() for v in variables]
-        data = pd.concat(dfs, axis=0, sort=True).reset_index(drop=True)
+        # When all inputs share the same columns (the typical case), stack
+        # the underlying arrays directly; this skips concat's index
+        # alignment and block-consolidation passes.
+        columns = set(dfs[0].columns)
+        if all(set(df.columns) == columns for df in dfs[1:]):
+            data = pd.DataFrame(
+                {col: np.concatenate([np.asarray(df[col]) for df in dfs])
+                 for col in sorted(columns)})
+        else:
+            data = pd.concat(dfs, axis=0, sort=True).reset_index(drop=True)
         data = data.rename(columns={name: 'amplitude'})
         return cls(name, data, source=variables[0].source, **kwargs)
 
@@ -325,6 +415,7 @@ class SimpleVariable(BIDSVariable):
         for prop in self._property_columns:
             vals = getattr(self, prop)[rows]
             setattr(self, prop, vals)
+        self._grouper_cache = {}
 
 
 class SparseRunVariable(SimpleVariable):
@@ -351,14 +442,25 @@ class SparseRunVariable(SimpleVariable):
     _property_columns = {'onset', 'duration'}
 
     def __init__(self, name, data, run_info, source, **kwargs):
-        if hasattr(run_info, 'duration'):
-            run_info = [run_info]
+        # The common case is an existing list; only fall back on the
+        # attribute check when wrapping a single RunInfo.
         if not isinstance(run_info, list):
-            raise TypeError("We expect a list of run_info, got %s"
-                            % repr(run_info))
+            if not hasattr(run_info, 'duration'):
+                raise TypeError("We expect a list of run_info, got %s"
+                                % repr(run_info))
+            run_info = [run_info]
         self.run_info = run_info
-        for sc in self._property_columns:
-            setattr(self, sc, data.pop(sc).values)
+        # Store timing columns as contiguous float64 arrays rather than
+        # pandas structures, so downstream numpy ops (thresholding, algebra,
+        # densification) run directly on the buffers without dtype conversion
+        # or block-manager indirection. The full DataFrame is only
+        # materialized on demand via to_df(). All columns are pulled in a
+        # single gather rather than one pandas lookup per column.
+        prop_cols = list(self._property_columns)
+        prop_vals = data[prop_cols].to_numpy(dtype=np.float64)
+        for i, sc in enumerate(prop_cols):
+            setattr(self, sc, np.ascontiguousarray(prop_vals[:, i]))
+        data = data.drop(columns=prop_cols)
         super(SparseRunVariable, self).__init__(name, data, source, **kwargs)
 
     def get_duration(self):
@@ -396,22 +498,34 @@ class SparseRunVariable(SimpleVariable):
         duration = int(math.ceil(bin_sr * self.get_duration()))
         ts = np.zeros(duration, dtype=self.values.dtype)
 
-        onsets = np.round(self.onset * bin_sr).astype(int)
-        durations = np.round(self.duration * bin_sr).astype(int)
-
-        run_i, start, last_ind = 0, 0, 0
-        for i, val in enumerate(self.values.values):
-            if onsets[i] < last_ind:
-                start += self.run_info[run_i].duration * bin_sr
-                run_i += 1
-            _onset = int(start + onsets[i])
-            _offset = int(_onset + durations[i])
-            if _onset >= duration:
-                warnings.warn("The onset time of a variable seems to exceed "
-                              "the runs duration, hence runs are incremented "
-                              "by one internally.")
-            ts[_onset:_offset] = val
-            last_ind = onsets[i]
+        onsets = np.round(self.onset * bin_sr).astype(np.intp)
+        durations = np.round(self.duration * bin_sr).astype(np.intp)
+
+        # Onsets are monotonic within a run, so a decrease marks the start of
+        # the next run; offset each event by the cumulative duration of all
+        # preceding runs.
+        run_idx = np.zeros(len(onsets), dtype=np.intp)
+        if len(onsets) > 1:
+            run_idx[1:] = np.cumsum(np.diff(onsets) < 0)
+        run_durs = np.array([r.duration for r in self.run_info]) * bin_sr
+        run_starts = np.concatenate([[0], np.cumsum(run_durs[:-1])])
+        onsets = (run_starts[run_idx] + onsets).astype(np.intp)
+
+        if len(onsets) and onsets.max() >= duration:
+            warnings.warn("The onset time of a variable seems to exceed "
+                          "the runs duration, hence runs are incremented "
+                          "by one internally.")
+
+        # Expand every event into its sample indices in a single repeat pass.
+        # Assignment order follows event order, so later events overwrite
+        # earlier ones where they overlap, as in the original per-event loop.
+        ends = np.cumsum(durations)
+        within = np.arange(ends[-1] if len(ends) else 0) - \
+            np.repeat(ends - durations, durations)
+        idx = np.repeat(onsets, durations) + within
+        vals = np.repeat(self.values.values, durations)
+        keep = idx < duration
+        ts[idx[keep]] = vals[keep]
 
         run_info = list(self.run_info)
         dense_var = DenseRunVariable(
@@ -466,7 +580,7 @@ class DenseRunVariable(BIDSVariable):
 
         values = pd.DataFrame(values)
 
-        if hasattr(run_info, 'duration'):
+        if not isinstance(run_info, list) and hasattr(run_info, 'duration'):
             run_info = [run_info]
         self.run_info = run_info
         self.sampling_rate = sampling_rate
@@ -488,35 +602,77 @@ class DenseRunVariable(BIDSVariable):
         -------
         A list of DenseRunVariables, one per unique value in the grouper.
         """
-        values = grouper.values * self.values.values
-        df = pd.DataFrame(values, columns=grouper.columns)
+        # Multiply one grouper column at a time rather than materializing
+        # the full (n_samples, n_groups) product DataFrame up front.
+        vals = self.values.values.ravel()
+        group_vals = grouper.values
         return [DenseRunVariable(name='%s.%s' % (self.name, name),
-                                 values=df[name].values,
+                                 values=vals * group_vals[:, i],
                                  run_info=self.run_info,
                                  source=self.source,
                                  sampling_rate=self.sampling_rate)
-                for i, name in enumerate(df.columns)]
+                for i, name in enumerate(grouper.columns)]
         
+    # Entity indexes, keyed on run timing/entity content and sampling rate.
+    # Variables in a collection typically share run_info, so each distinct
+    # index only needs to be constructed once per sampling rate.
+    _index_cache = {}
+
     def _build_entity_index(self, run_info, sampling_rate, match_vol=False):
         """Build the entity index from run information. """
 
-        index = []
-        _timestamps = []
-        for run in run_info:
-            if match_vol:
-                # If TR, fix reps to n_vols to ensure match
-                reps = run.n_vols
-            else:
-                reps = int(math.ceil(run.duration * sampling_rate))
-
-            interval = int(round(1000. / sampling_rate))            
-            ent_vals = list(run.entities.values())
-            df = pd.DataFrame([ent_vals] * reps, columns=list(run.entities.keys()))
-            ts = pd.date_range(0, periods=len(df), freq='%sms' % interval)
-            _timestamps.append(ts.to_series())
-            index.append(df)
-        self.timestamps = pd.concat(_timestamps, axis=0, sort=True)
-        return pd.concat(index, axis=0, sort=True).reset_index(drop=True)
+        try:
+            cache_key = (tuple((tuple(run.entities.items()), run.duration,
+                                run.tr, run.n_vols) for run in run_info),
+                         sampling_rate, match_vol)
+            cached = self._index_cache.get(cache_key)
+        except TypeError:  # unhashable entity values
+            cache_key = cached = None
+
+        if cached is not None:
+            index, timestamps = cached
+            self.timestamps = timestamps.copy()
+            return index.copy()
+
+        interval = int(round(1000. / sampling_rate))
+        if match_vol:
+            # If TR, fix reps to n_vols to ensure match
+            reps = np.array([run.n_vols for run in run_info], dtype=np.intp)
+        else:
+            reps = np.array([int(math.ceil(run.duration * sampling_rate))
+                             for run in run_info], dtype=np.intp)
+
+        keys = list(run_info[0].entities.keys())
+        if all(list(run.entities.keys()) == keys for run in run_info[1:]):
+            # All runs share the same entity keys (the typical case), so
+            # each column can be materialized with a single np.repeat over
+            # the per-run values, skipping the per-run DataFrame builds and
+            # the cross-run concat/consolidation pass.
+            index = pd.DataFrame(
+                {k: np.repeat([run.entities[k] for run in run_info], reps)
+                 for k in keys})
+            ts = np.concatenate(
+                [pd.date_range(0, periods=n, freq='%sms' % interval).values
+                 for n in reps])
+            self.timestamps = pd.Series(ts, index=ts)
+        else:
+            index = []
+            _timestamps = []
+            for run, n in zip(run_info, reps):
+                ent_vals = list(run.entities.values())
+                df = pd.DataFrame([ent_vals] * n,
+                                  columns=list(run.entities.keys()))
+                ts = pd.date_range(0, periods=n, freq='%sms' % interval)
+                _timestamps.append(ts.to_series())
+                index.append(df)
+            self.timestamps = pd.concat(_timestamps, axis=0, sort=True)
+            index = pd.concat(index, axis=0, sort=True).reset_index(drop=True)
+        if cache_key is not None:
+            if len(self._index_cache) >= 64:
+                self._index_cache.pop(next(iter(self._index_cache)))
+            self._index_cache[cache_key] = (index.copy(),
+                                            self.timestamps.copy())
+        return index
 
     def resample(self, sampling_rate, inplace=False, kind='linear'):
         """Resample the Variable to the specified sampling rate.
@@ -549,7 +705,8 @@ class DenseRunVariable(BIDSVariable):
         n = len(self.index)
 
         self.index = self._build_entity_index(self.run_info, sampling_rate, match_vol)
-        
+        self._grouper_cache = {}
+
         x = np.arange(n)
         num = len(self.index)
 
@@ -563,10 +720,18 @@ class DenseRunVariable(BIDSVariable):
         else:
             y = self.values.values.ravel()
 
-        from scipy.interpolate import interp1d
-        f = interp1d(x, y, kind=kind)
         x_new = np.linspace(0, n - 1, num=num)
-        self.values = pd.DataFrame(f(x_new))
+        if kind == 'linear':
+            # Direct C routine; avoids interp1d's generic-kind dispatch.
+            new_vals = np.interp(x_new, x, y)
+        elif kind in ('quadratic', 'cubic'):
+            from scipy.interpolate import make_interp_spline
+            k = {'quadratic': 2, 'cubic': 3}[kind]
+            new_vals = make_interp_spline(x, y, k=k)(x_new)
+        else:
+            from scipy.interpolate import interp1d
+            new_vals = interp1d(x, y, kind=kind)(x_new)
+        self.values = pd.DataFrame(new_vals)
         assert len(self.values) == len(self.index)
 
         self.sampling_rate = sampling_rate
@@ -615,8 +780,16 @@ class DenseRunVariable(BIDSVariable):
                            " rate found." % (name, rates))
                     raise ValueError(msg)
 
-        variables = [v.resample(sampling_rate) for v in variables]
-        values = pd.concat([v.values for v in variables], axis=0, sort=True)
+        # Only variables at a different rate need the clone+resample pass;
+        # the rest contribute their existing buffers. np.concatenate then
+        # fills a single preallocated output array, skipping pd.concat's
+        # index alignment and block consolidation.
+        arrays = []
+        for v in variables:
+            if v.sampling_rate != sampling_rate:
+                v = v.resample(sampling_rate)
+            arrays.append(v.values.values.ravel())
+        values = np.concatenate(arrays)
         run_info = list(chain(*[v.run_info for v in variables]))
         source = variables[0].source
         return DenseRunVariable(